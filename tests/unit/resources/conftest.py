@@ -0,0 +1,70 @@
+###
+# (C) Copyright [2019-2020] Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+from unittest import mock
+
+import pytest
+
+from simplivity.resources import cluster_groups
+from simplivity.resources import hosts
+from simplivity.resources import omnistack_clusters as clusters
+from simplivity.resources import policies
+
+
+# The resource classes only reach the Connection through these attributes, so a
+# plain Mock restricted to them stands in for it without patching or autospec.
+_CONN_MOCK_SPEC = ["get", "post", "delete", "_access_token"]
+
+
+@pytest.fixture(scope="module")
+def connection_mock():
+    """Connection mock shared by every test of a module; conn_mocks resets it per test."""
+    connection = mock.Mock(spec_set=_CONN_MOCK_SPEC)
+    connection._access_token = "123456789"
+    return connection
+
+
+@pytest.fixture(scope="module")
+def hosts_client(connection_mock):
+    return hosts.Hosts(connection_mock)
+
+
+@pytest.fixture(scope="module")
+def policies_client(connection_mock):
+    return policies.Policies(connection_mock)
+
+
+@pytest.fixture(scope="module")
+def clusters_client(connection_mock):
+    return clusters.OmnistackClusters(connection_mock)
+
+
+@pytest.fixture(scope="module")
+def cluster_groups_client(connection_mock):
+    return cluster_groups.ClusterGroups(connection_mock)
+
+
+# Payloads that test modules share between tests are MappingProxyType/tuple views,
+# so a test that mutates one fails instead of leaking into the next.
+@pytest.fixture
+def conn_mocks(connection_mock):
+    """Returns the connection mock with the calls and return values of earlier tests cleared."""
+    connection_mock.reset_mock()
+    # Before Python 3.9 reset_mock() does not pass return_value/side_effect down to
+    # child mocks, so the request methods are reset one by one.
+    for method in (connection_mock.get, connection_mock.post, connection_mock.delete):
+        method.reset_mock(return_value=True, side_effect=True)
+    return connection_mock
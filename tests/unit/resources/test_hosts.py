@@ -14,170 +14,75 @@
 # limitations under the License.
 ##
 
-import unittest
-from unittest import mock
+from types import MappingProxyType
 
-from simplivity.connection import Connection
-from simplivity import exceptions
-from simplivity.resources import hosts
-
-
-class HostsTest(unittest.TestCase):
-    def setUp(self):
-        self.connection = Connection('127.0.0.1')
-        self.connection._access_token = "123456789"
-        self.hosts = hosts.Hosts(self.connection)
-
-    @mock.patch.object(Connection, "get")
-    def test_get_all_returns_resource_obj(self, mock_get):
-        url = "{}?case=sensitive&limit=500&offset=0&order=descending&sort=name".format(hosts.URL)
-        resource_data = [{'id': '12345'}, {'id': '67890'}]
-        mock_get.return_value = {hosts.DATA_FIELD: resource_data}
-
-        objs = self.hosts.get_all()
-        self.assertIsInstance(objs[0], hosts.Host)
-        self.assertEqual(objs[0].data, resource_data[0])
-        mock_get.assert_called_once_with(url)
-
-    @mock.patch.object(Connection, "get")
-    def test_get_by_name_found(self, mock_get):
-        name = "testname"
-        url = "{}?case=sensitive&limit=500&name={}&offset=0&order=descending&sort=name".format(hosts.URL, name)
-        resource_data = [{'id': '12345', 'name': name}]
-        mock_get.return_value = {hosts.DATA_FIELD: resource_data}
-
-        obj = self.hosts.get_by_name(name)
-        self.assertIsInstance(obj, hosts.Host)
-        mock_get.assert_called_once_with(url)
-
-    @mock.patch.object(Connection, "get")
-    def test_get_by_name_not_found(self, mock_get):
-        name = "testname"
-        resource_data = []
-        mock_get.return_value = {hosts.DATA_FIELD: resource_data}
-
-        with self.assertRaises(exceptions.HPESimpliVityResourceNotFound) as error:
-            self.hosts.get_by_name(name)
-
-        self.assertEqual(error.exception.msg, "Resource not found with the name {}".format(name))
-
-    @mock.patch.object(Connection, "get")
-    def test_get_by_id_found(self, mock_get):
-        resource_id = "12345"
-        url = "{}?case=sensitive&id={}&limit=500&offset=0&order=descending&sort=name".format(hosts.URL, resource_id)
-        resource_data = [{'id': resource_id}]
-        mock_get.return_value = {hosts.DATA_FIELD: resource_data}
-
-        obj = self.hosts.get_by_id(resource_id)
-        self.assertIsInstance(obj, hosts.Host)
-        mock_get.assert_called_once_with(url)
-
-    @mock.patch.object(Connection, "get")
-    def test_get_by_id_not_found(self, mock_get):
-        resource_id = "12345"
-        resource_data = []
-        mock_get.return_value = {hosts.DATA_FIELD: resource_data}
-
-        with self.assertRaises(exceptions.HPESimpliVityResourceNotFound) as error:
-            self.hosts.get_by_id(resource_id)
-
-        self.assertEqual(error.exception.msg, "Resource not found with the id {}".format(resource_id))
-
-    def test_get_by_data(self):
-        resource_data = {'id': '12345'}
-
-        obj = self.hosts.get_by_data(resource_data)
-        self.assertIsInstance(obj, hosts.Host)
-        self.assertEqual(obj.data, resource_data)
-
-    @mock.patch.object(Connection, "post")
-    def test_remove(self, mock_post):
-        mock_post.return_value = None, [{"object_id": "12345"}]
-
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        host.remove()
-        self.assertEqual(host.data, None)
-
-        mock_post.assert_called_once_with(
-            "/hosts/12345/remove_from_federation",
-            {"force": False},
-            custom_headers={"Content-type": "application/vnd.simplivity.v1.9+json"},
-        )
-
-    @mock.patch.object(Connection, "post")
-    def test_remove_with_force(self, mock_post):
-        mock_post.return_value = None, [{"object_id": "12345"}]
-
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        host.remove(force=True)
-        self.assertEqual(host.data, None)
-
-        mock_post.assert_called_once_with(
-            "/hosts/12345/remove_from_federation",
-            {"force": True},
-            custom_headers={"Content-type": "application/vnd.simplivity.v1.9+json"},
-        )
-
-    @mock.patch.object(Connection, "get")
-    def test_get_hardware(self, mock_get):
-        resource_data = {"host": {"serial_number": "abcdef", "manufacturer": "HPE",
-                                  "model_number": "ProLiant DL380 Gen9", "status": "GREEN",
-                                  "host_id": "12345"
-                                  }}
-
-        mock_get.return_value = resource_data
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        hardware_data = host.get_hardware()
-        self.assertEqual(hardware_data, resource_data)
-
-    @mock.patch.object(Connection, "get")
-    def test_get_virtual_controller_shutdown_status(self, mock_get):
-        resource_data = {"shutdown_status": {"status": "NONE"}}
-        mock_get.return_value = resource_data
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        virtual_controller_status = host.get_virtual_controller_shutdown_status()
-        self.assertEqual(virtual_controller_status, 'NONE')
-
-    @mock.patch.object(Connection, "post")
-    def test_shutdown_virtual_controller_ha_wait(self, mock_post):
-        mock_post.return_value = None, {'shutdown_status': {'status': 'IN_PROGRESS'}}
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-        response = host.shutdown_virtual_controller()
-        self.assertEqual(response, 'IN_PROGRESS')
-        mock_post.assert_called_once_with("/hosts/12345/shutdown_virtual_controller",
-                                          {"ha_wait": True}, custom_headers=None)
-
-    @mock.patch.object(Connection, "post")
-    def test_shutdown_virtual_controller(self, mock_post):
-        mock_post.return_value = None, {'shutdown_status': {'status': 'IN_PROGRESS'}}
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        response = host.shutdown_virtual_controller(ha_wait=False)
-        self.assertEqual(response, 'IN_PROGRESS')
-        mock_post.assert_called_once_with("/hosts/12345/shutdown_virtual_controller",
-                                          {"ha_wait": False}, custom_headers=None)
-
-    @mock.patch.object(Connection, "post")
-    def test_cancel_virtual_controller_shutdown(self, mock_post):
-        mock_post.return_value = None, {'cancellation_status': {'status': 'SUCCESS'}}
-        host_data = {"id": "12345"}
-        host = self.hosts.get_by_data(host_data)
-
-        response = host.cancel_virtual_controller_shutdown()
-        self.assertEqual(response, "SUCCESS")
-        mock_post.assert_called_once_with("/hosts/12345/cancel_virtual_controller_shutdown", None,
-                                          custom_headers=None)
-
-
-if __name__ == '__main__':
-    unittest.main()
+import pytest
+
+_HOST_DATA = MappingProxyType({"id": "12345"})
+_REMOVE_RESPONSE = (None, (MappingProxyType({"object_id": "12345"}),))
+_HARDWARE_RESPONSE = MappingProxyType({"host": MappingProxyType({
+    "serial_number": "abcdef", "manufacturer": "HPE", "model_number": "ProLiant DL380 Gen9",
+    "status": "GREEN", "host_id": "12345"})})
+_SHUTDOWN_STATUS_RESPONSE = MappingProxyType({"shutdown_status": MappingProxyType({"status": "NONE"})})
+_SHUTDOWN_IN_PROGRESS_RESPONSE = (None, MappingProxyType({'shutdown_status': MappingProxyType({'status': 'IN_PROGRESS'})}))
+_CANCEL_SUCCESS_RESPONSE = (None, MappingProxyType({'cancellation_status': MappingProxyType({'status': 'SUCCESS'})}))
+
+
+@pytest.fixture(scope="module")
+def host(hosts_client):
+    """Host shared by the tests that leave its data untouched; test_remove builds its own."""
+    return hosts_client.get_by_data(_HOST_DATA)
+
+
+@pytest.mark.parametrize("kwargs,force", [
+    ({}, False),
+    ({"force": True}, True),
+], ids=["default", "force"])
+def test_remove(hosts_client, conn_mocks, kwargs, force):
+    conn_mocks.post.return_value = _REMOVE_RESPONSE
+    host = hosts_client.get_by_data(_HOST_DATA)
+
+    host.remove(**kwargs)
+    assert host.data is None
+
+    conn_mocks.post.assert_called_once_with(
+        "/hosts/12345/remove_from_federation",
+        {"force": force},
+        custom_headers={"Content-type": "application/vnd.simplivity.v1.9+json"},
+    )
+
+
+def test_get_hardware(host, conn_mocks):
+    conn_mocks.get.return_value = _HARDWARE_RESPONSE
+
+    hardware_data = host.get_hardware()
+    assert hardware_data == _HARDWARE_RESPONSE
+
+
+def test_get_virtual_controller_shutdown_status(host, conn_mocks):
+    conn_mocks.get.return_value = _SHUTDOWN_STATUS_RESPONSE
+
+    virtual_controller_status = host.get_virtual_controller_shutdown_status()
+    assert virtual_controller_status == 'NONE'
+
+
+@pytest.mark.parametrize("kwargs,ha_wait", [
+    ({}, True),
+    ({"ha_wait": False}, False),
+], ids=["default", "no_ha_wait"])
+def test_shutdown_virtual_controller(host, conn_mocks, kwargs, ha_wait):
+    conn_mocks.post.return_value = _SHUTDOWN_IN_PROGRESS_RESPONSE
+
+    response = host.shutdown_virtual_controller(**kwargs)
+    assert response == 'IN_PROGRESS'
+    conn_mocks.post.assert_called_once_with("/hosts/12345/shutdown_virtual_controller",
+                                            {"ha_wait": ha_wait}, custom_headers=None)
+
+
+def test_cancel_virtual_controller_shutdown(host, conn_mocks):
+    conn_mocks.post.return_value = _CANCEL_SUCCESS_RESPONSE
+
+    response = host.cancel_virtual_controller_shutdown()
+    assert response == "SUCCESS"
+    conn_mocks.post.assert_called_once_with("/hosts/12345/cancel_virtual_controller_shutdown", None,
+                                            custom_headers=None)
@@ -0,0 +1,118 @@
+###
+# (C) Copyright [2019-2020] Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+##
+
+"""Lookup tests shared by the ResourceBase subclasses, run once per resource module."""
+
+from types import MappingProxyType
+from types import SimpleNamespace
+from urllib.parse import parse_qs
+from urllib.parse import quote_plus
+from urllib.parse import urlparse
+
+import pytest
+
+from simplivity import exceptions
+from simplivity.resources import hosts
+from simplivity.resources import policies
+
+_GET_ALL_PARAMS = {"case": ["sensitive"], "limit": ["500"], "offset": ["0"],
+                   "order": ["descending"], "sort": ["name"]}
+_GET_BY_NAME_QUERY = "?case=sensitive&limit=500&name={}&offset=0&order=descending&sort=name"
+_GET_BY_ID_QUERY = "?case=sensitive&id={}&limit=500&offset=0&order=descending&sort=name"
+
+_ID_12345 = MappingProxyType({'id': '12345'})
+_ALL_RESOURCES = (_ID_12345, MappingProxyType({'id': '67890'}))
+_NAMED_TESTNAME = MappingProxyType({'id': '12345', 'name': 'testname'})
+_NAMED_TEST_NAME = MappingProxyType({'id': '12345', 'name': 'test name'})
+
+# Per resource module: the module, its object class, the client fixture name and
+# the name/id lookup URL templates bound to str.format once.
+_RESOURCES = [
+    (hosts, hosts.Host, "hosts_client",
+     (hosts.URL + _GET_BY_NAME_QUERY).format, (hosts.URL + _GET_BY_ID_QUERY).format),
+    (policies, policies.Policy, "policies_client",
+     (policies.URL + _GET_BY_NAME_QUERY).format, (policies.URL + _GET_BY_ID_QUERY).format),
+]
+
+
+@pytest.fixture(params=_RESOURCES, ids=["hosts", "policies"])
+def resource(request):
+    """Runs a test once per resource module, with its object class, client and URL builders."""
+    module, resource_cls, client_fixture, name_url, id_url = request.param
+    return SimpleNamespace(module=module, cls=resource_cls,
+                           client=request.getfixturevalue(client_fixture),
+                           name_url=name_url, id_url=id_url)
+
+
+def _assert_called_once_with_url(mock_method, base_url, expected_params):
+    """Asserts a single call whose URL has base_url's path and exactly expected_params.
+
+    expected_params is compared against urllib.parse.parse_qs output, so the order of
+    the query string parameters does not matter.
+    """
+    mock_method.assert_called_once()
+    actual = urlparse(mock_method.call_args[0][0])
+    assert actual.path == urlparse(base_url).path
+    assert parse_qs(actual.query) == expected_params
+
+
+def test_get_all_returns_resource_obj(resource, conn_mocks):
+    conn_mocks.get.return_value = MappingProxyType({resource.module.DATA_FIELD: _ALL_RESOURCES})
+
+    objs = resource.client.get_all()
+    assert isinstance(objs[0], resource.cls)
+    assert objs[0].data == _ALL_RESOURCES[0]
+    _assert_called_once_with_url(conn_mocks.get, resource.module.URL, _GET_ALL_PARAMS)
+
+
+@pytest.mark.parametrize("lookup_field,value,resource_data", [
+    ("name", "testname", _NAMED_TESTNAME),
+    ("id", "12345", _ID_12345),
+], ids=["name", "id"])
+def test_get_by_found(resource, conn_mocks, lookup_field, value, resource_data):
+    conn_mocks.get.return_value = MappingProxyType({resource.module.DATA_FIELD: (resource_data,)})
+
+    obj = getattr(resource.client, "get_by_" + lookup_field)(value)
+    assert isinstance(obj, resource.cls)
+    conn_mocks.get.assert_called_once_with(getattr(resource, lookup_field + "_url")(value))
+
+
+@pytest.mark.parametrize("lookup_field,value,message", [
+    ("name", "testname", "Resource not found with the name testname"),
+    ("id", "12345", "Resource not found with the id 12345"),
+], ids=["name", "id"])
+def test_get_by_not_found(resource, conn_mocks, lookup_field, value, message):
+    conn_mocks.get.return_value = MappingProxyType({resource.module.DATA_FIELD: ()})
+
+    with pytest.raises(exceptions.HPESimpliVityResourceNotFound) as error:
+        getattr(resource.client, "get_by_" + lookup_field)(value)
+
+    assert error.value.msg == message
+
+
+def test_get_by_name_url_encoded(resource, conn_mocks):
+    name = _NAMED_TEST_NAME['name']
+    conn_mocks.get.return_value = MappingProxyType({resource.module.DATA_FIELD: (_NAMED_TEST_NAME,)})
+
+    obj = resource.client.get_by_name(name)
+    assert isinstance(obj, resource.cls)
+    conn_mocks.get.assert_called_once_with(resource.name_url(quote_plus(name)))
+
+
+def test_get_by_data(resource):
+    obj = resource.client.get_by_data(_ID_12345)
+    assert isinstance(obj, resource.cls)
+    assert obj.data == _ID_12345